@@ -59,18 +59,14 @@ __all__ = ['lazy_module', 'lazy_callable', 'lazy_function', 'lazy_class',
 
 from types import ModuleType
 import sys
-try:
-    from importlib._bootstrap import _ImportLockContext
-except ImportError:
-    # Python 2 doesn't have the context manager. Roll it ourselves (copied from
-    # Python 3's importlib/_bootstrap.py)
-    import imp
-    class _ImportLockContext:
-        """Context manager for the import lock."""
-        def __enter__(self):
-            imp.acquire_lock()
-        def __exit__(self, exc_type, exc_value, exc_traceback):
-            imp.release_lock()
+from importlib._bootstrap import (_ImportLockContext, _ModuleLockManager,
+                                  _find_spec, _exec)
+# Bound once, since these are called on every access to a lazy module.
+_MOD_GETATTR = ModuleType.__getattribute__
+_MOD_SETATTR = ModuleType.__setattr__
+# LazyModule shadows ModuleType's __dict__ (see _LoadingAttribute), so the
+# instance dict must be reached directly.
+_MOD_DICT = ModuleType.__dict__['__dict__'].__get__
 
 
 # Adding a __spec__ doesn't really help. I'll leave the code here in case
@@ -80,18 +76,18 @@ except ImportError:
 #except ImportError:
 #    ModuleSpec = None
 
-import six
-from six import raise_from
-from six.moves import reload_module
 # It is sometime useful to have access to the version number of a library.
 # This is usually done through the __version__ special attribute.
 # To make sure the version number is consistent between setup.py and the
 # library, we read the version number from the file called VERSION that stays
-# in the module directory.
+# in the module directory. The file is only read upon first access to
+# __version__ (see the module's __getattr__, at the end).
 import os
 VERSION_FILE = os.path.join(os.path.dirname(__file__), 'VERSION')
-with open(VERSION_FILE) as infile:
-    __version__ = infile.read().strip()
+
+def _read_version():
+    with open(VERSION_FILE) as infile:
+        return infile.read().strip()
 
 # Logging
 import logging
@@ -116,71 +112,112 @@ logger = logging.getLogger(__name__)
 
 #### Lazy classes ####
 
+class _LoadingAttribute(object):
+    """Data descriptor for :class:`LazyModule` attributes that must trigger
+    loading even though the instance already has them.
+
+    Access from the class returns *classvalue* instead.
+    """
+    def __init__(self, name, classvalue=None):
+        self.name = name
+        self.classvalue = classvalue
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.classvalue
+        if _from_ipython_inspection(self.name):
+            raise AttributeError
+        _load_module(instance)
+        # We've been loaded, so this no longer finds this descriptor.
+        return _MOD_GETATTR(instance, self.name)
+
+    def __set__(self, instance, value):
+        _load_module(instance)
+        _MOD_SETATTR(instance, self.name, value)
+
+    def __delete__(self, instance):
+        _load_module(instance)
+        delattr(instance, self.name)
+
+
 class LazyModule(ModuleType):
     """Class for lazily-loaded modules that triggers proper loading on access.
 
-    Instantiation should be made from a subclass of :class:`LazyModule`, with
-    one subclass per instantiated module. Regular attribute set/access can then
-    be recovered by setting the subclass's :meth:`__getattribute__` and
-    :meth:`__setattribute__` to those of :class:`types.ModuleType`.
+    Lazy state (error messages, lazy callables and submodule references) is
+    kept as instance attributes, set through
+    :meth:`types.ModuleType.__setattr__` so as not to trigger loading. Regular
+    attribute set/access is recovered upon loading by setting the instance's
+    `__class__` to :class:`types.ModuleType`.
+
+    Loading is triggered from :meth:`__getattr__`, which Python only calls for
+    attributes the instance doesn't have. Those it has before loading (its
+    `__name__` and `__spec__`, references to lazily-imported submodules, and
+    the lazy state) are served as fast as from any regular module. Loading is
+    also triggered by accessing `__doc__` or `__dict__` (and hence by
+    :func:`vars`), by :func:`dir`, and by setting any attribute.
     """
+    __doc__ = _LoadingAttribute('__doc__', __doc__)
+    __dict__ = _LoadingAttribute('__dict__')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every class gets its own __doc__ (None if it has no docstring),
+        # which would shadow ours.
+        cls.__doc__ = _LoadingAttribute('__doc__', cls.__dict__['__doc__'])
+
     # peak.util.imports sets __slots__ to (), but it seems pointless because
     # the base ModuleType doesn't itself set __slots__.
-    def __getattribute__(self, attr):
+    def __getattr__(self, attr):
+        moddict = _MOD_DICT(self)
         logger.debug("Getting attr {} of LazyModule instance of {}"
-                     .format(attr, super(LazyModule, self)
-                             .__getattribute__("__name__")))
+                     .format(attr, moddict['__name__']))
         logger.lazy_trace()
-        # IPython tries to be too clever and constantly inspects, asking for
-        #  modules' attrs, which causes premature module loading and unesthetic
-        #  internal errors if the lazily-loaded module doesn't exist.
-        if (run_from_ipython()
-            and (attr.startswith(("__", "_ipython"))
-                 or attr == "_repr_mimebundle_")
-            and module_basename(_caller_name()) in ('inspect', 'IPython')):
-                logger.debug("Ignoring request for {}, deemed from IPython's "
-                             "inspection.".format(super(LazyModule, self)
-                                     .__getattribute__("__name__"), attr))
-                raise AttributeError
-        if not attr in ('__name__','__class__','__spec__'):
-            # __name__ and __class__ yield their values from the LazyModule;
-            # __spec__ causes an AttributeError. Maybe in the future it will be
-            # necessary to return an actual ModuleSpec object, but it works as
-            # it is without that now.
-
-            # If it's an already-loaded submodule, we return it without
-            # triggering a full loading
-            try:
-                return sys.modules[self.__name__+"."+attr]
-            except KeyError:
-                pass
-            # Check if it's one of the lazy callables
-            try:
-                _callable = type(self)._lazy_import_callables[attr]
-                logger.debug("Returning lazy-callable '{}'.".format(attr))
-                return _callable
-            except (AttributeError, KeyError) as err:
-                logger.debug("Proceeding to load module {}, "
-                             "from requested value {}"
-                             .format(super(LazyModule, self)
-                                     .__getattribute__("__name__"), attr))
-                _load_module(self)
-        logger.debug("Returning value '{}'.".format(super(LazyModule, self)
-                                     .__getattribute__(attr)))
-        return super(LazyModule, self).__getattribute__(attr)
+        if _from_ipython_inspection(attr):
+            raise AttributeError
+        # If it's an already-loaded submodule, we return it without
+        # triggering a full loading
+        submod = sys.modules.get(moddict['__name__'] + "." + attr)
+        if submod is not None:
+            return submod
+        # Check if it's one of the lazy callables
+        callables = moddict.get('_lazy_import_callables')
+        if callables is not None and attr in callables:
+            logger.debug("Returning lazy-callable '{}'.".format(attr))
+            return callables[attr]
+        logger.debug("Proceeding to load module {}, "
+                     "from requested value {}"
+                     .format(moddict['__name__'], attr))
+        _load_module(self)
+        # We've been loaded (and are no longer a LazyModule instance), so
+        # super() can't be used.
+        value = _MOD_GETATTR(self, attr)
+        logger.debug("Returning value '{}'.".format(value))
+        return value
 
     def __setattr__(self, attr, value):
         logger.debug("Setting attr {} to value {}, in LazyModule instance "
-                     "of {}".format(attr, value, super(LazyModule, self)
-                                    .__getattribute__("__name__")))
+                     "of {}".format(attr, value,
+                                    _MOD_GETATTR(self, "__name__")))
+        _load_module(self)
+        return _MOD_SETATTR(self, attr, value)
+
+    def __dir__(self):
         _load_module(self)
-        return super(LazyModule, self).__setattr__(attr, value)
+        return ModuleType.__dir__(self)
+
+    def __repr__(self):
+        return "Lazily-loaded module {}".format(self.__name__)
 
 
 class LazyCallable(object):
     """Class for lazily-loaded callables that triggers module loading on access
 
     """
+    # Slots keep instances small and attribute access fast, which matters
+    # when many callables get lazily imported.
+    __slots__ = ('module', 'cname', 'modclass', 'callable', 'error_msgs',
+                 'error_strings')
+
     def __init__(self, *args):
         if len(args) != 2:
             # Maybe the user tried to base a class off this lazy callable?
@@ -193,37 +230,42 @@ class LazyCallable(object):
                                               "a lazy callable as a class "
                                               "base. This is not supported.")
             except (IndexError, TypeError):
-                raise_from(TypeError("LazyCallable takes exactly 2 arguments: "
+                raise TypeError("LazyCallable takes exactly 2 arguments: "
                                 "a module/lazy module object and the name of "
-                                "a callable to be lazily loaded."), None)
+                                "a callable to be lazily loaded.") from None
         self.module, self.cname = args
         self.modclass = type(self.module)
         self.callable = None
         # Need to save these, since the module-loading gets rid of them
-        self.error_msgs = self.modclass._lazy_import_error_msgs
-        self.error_strings = self.modclass._lazy_import_error_strings
+        self.error_msgs = _MOD_GETATTR(self.module, '_lazy_import_error_msgs')
+        self.error_strings = _MOD_GETATTR(self.module,
+                                          '_lazy_import_error_strings')
 
     def __call__(self, *args, **kwargs):
-        # No need to go through all the reloading more than once.
-        if self.callable:
+        # No need to go through all the reloading more than once. Once the
+        # module is loaded, its lazy state is gone and fresh lookups of
+        # module.cname already get the real callable, not this wrapper.
+        if self.callable is not None:
             return self.callable(*args, **kwargs)
         try:
-            del self.modclass._lazy_import_callables[self.cname]
+            del _MOD_GETATTR(self.module, '_lazy_import_callables')[self.cname]
         except (AttributeError, KeyError):
             pass
         try:
             self.callable = getattr(self.module, self.cname)
         except AttributeError:
             msg = self.error_msgs['msg_callable']
-            raise_from(AttributeError(
-                msg.format(callable=self.cname, **self.error_strings)), None)
+            raise AttributeError(msg.format(callable=self.cname,
+                                            **self.error_strings)) from None
         except ImportError as err:
             # Import failed. We reset the dict and re-raise the ImportError.
             try:
-                self.modclass._lazy_import_callables[self.cname] = self
+                _MOD_GETATTR(
+                    self.module, '_lazy_import_callables')[self.cname] = self
             except AttributeError:
-                self.modclass._lazy_import_callables = {self.cname: self}
-            raise_from(err, None)
+                _MOD_SETATTR(self.module, '_lazy_import_callables',
+                             {self.cname: self})
+            raise err from None
         else:
             return self.callable(*args, **kwargs)
 
@@ -325,6 +367,17 @@ def lazy_module(modname, error_strings=None, lazy_mod_class=LazyModule,
         error_strings = {}
     _set_default_errornames(modname, error_strings)
 
+    # Already-registered modules (lazy or not) can be returned straight from
+    # sys.modules, without grabbing the import lock.
+    mod = sys.modules.get(modname)
+    if mod is not None:
+        if level == 'leaf':
+            return mod
+        elif level == 'base':
+            base = sys.modules.get(module_basename(modname))
+            if base is not None:
+                return base
+
     mod = _lazy_module(modname, error_strings, lazy_mod_class)
     if level == 'base':
         return sys.modules[module_basename(modname)]
@@ -336,49 +389,75 @@ def lazy_module(modname, error_strings=None, lazy_mod_class=LazyModule,
 
 def _lazy_module(modname, error_strings, lazy_mod_class):
     with _ImportLockContext():
-        fullmodname = modname
-        fullsubmodname = None
+        if not '.' in modname:
+            # Top-level modules (the most common case) have no parents to
+            # go through.
+            try:
+                return sys.modules[modname]
+            except KeyError:
+                return _new_lazymodule(modname, error_strings, lazy_mod_class)
+        # The full names of modname and of its parents, built once from the
+        # base down: 'aaa', 'aaa.bbb', 'aaa.bbb.ccc'.
+        submodnames = modname.split('.')
+        fullnames = [submodnames[0]]
+        for submodname in submodnames[1:]:
+            fullnames.append(fullnames[-1] + '.' + submodname)
+        submod = None
         # ensure parent module/package is in sys.modules
         # and parent.modname=module, as soon as the parent is imported   
-        while modname:
+        for depth in range(len(fullnames) - 1, -1, -1):
+            fullname = fullnames[depth]
             try:
-                mod = sys.modules[modname]
-                # We reached a (base) module that's already loaded. Let's stop
-                # the cycle. Can't use 'break' because we still want to go 
-                # through the fullsubmodname check below.
-                modname = ''
+                mod = sys.modules[fullname]
+                # We reached a (base) module that's already loaded. We'll
+                # stop the cycle after going through the submod check below.
+                loaded = True
             except KeyError:
-                err_s = error_strings.copy()
-                err_s.setdefault('module', modname)
-
-                class _LazyModule(lazy_mod_class):
-                    _lazy_import_error_msgs = {'msg': err_s.pop('msg')}
+                loaded = False
+                mod = _new_lazymodule(fullname, error_strings, lazy_mod_class)
+            if submod is not None:
+                submodname = submodnames[depth + 1]
+                _MOD_SETATTR(mod, submodname, submod)
+                # Loading switches a module out of its lazy state while
+                # holding the import lock, so this check stays valid while we
+                # record the submodule.
+                if isinstance(mod, LazyModule):
+                    moddict = _MOD_DICT(mod)
                     try:
-                        _lazy_import_error_msgs['msg_callable'] = \
-                                err_s.pop('msg_callable')
+                        moddict['_lazy_import_submodules'][submodname] = submod
                     except KeyError:
-                        pass
-                    _lazy_import_error_strings = err_s
-                    _lazy_import_callables = {}
-                    _lazy_import_submodules = {}
-
-                    def __repr__(self):
-                        return "Lazily-loaded module {}".format(self.__name__)
-                # A bit of cosmetic, to make AttributeErrors read more natural  
-                _LazyModule.__name__ = 'module'
-                # Actual module instantiation
-                mod = sys.modules[modname] = _LazyModule(modname)
-                # No need for __spec__. Maybe in the future.
-                #if ModuleSpec:
-                #    ModuleType.__setattr__(mod, '__spec__',
-                #            ModuleSpec(modname, None))
-            if fullsubmodname:
-                submod = sys.modules[fullsubmodname]
-                ModuleType.__setattr__(mod, submodname, submod)
-                _LazyModule._lazy_import_submodules[submodname] = submod
-            fullsubmodname = modname
-            modname, _, submodname = modname.rpartition('.')
-        return sys.modules[fullmodname]
+                        moddict['_lazy_import_submodules'] = {submodname:
+                                                              submod}
+            if loaded:
+                break
+            submod = mod
+        return sys.modules[modname]
+
+
+def _new_lazymodule(modname, error_strings, lazy_mod_class):
+    """Instantiates a lazy module and registers it in `sys.modules`.
+
+    Must be called with the import lock held.
+    """
+    err_s = error_strings.copy()
+    err_s.setdefault('module', modname)
+    err_msgs = _error_msgs(err_s.pop('msg'), err_s.pop('msg_callable', None))
+    # Actual module instantiation. Lazy state is set directly on the
+    # instance, bypassing LazyModule.__setattr__.
+    mod = sys.modules[modname] = lazy_mod_class(modname)
+    # Access to these must go through LazyModule.__getattr__, and trigger
+    # loading. (__doc__ is kept, but shadowed by LazyModule.__doc__.)
+    for attr in ('__package__', '__loader__'):
+        _MOD_DICT(mod).pop(attr, None)
+    _MOD_SETATTR(mod, '_lazy_import_error_msgs', err_msgs)
+    _MOD_SETATTR(mod, '_lazy_import_error_strings', err_s)
+    # _lazy_import_callables and _lazy_import_submodules are only created when
+    # there is something to put in them.
+    # No need for __spec__. Maybe in the future.
+    #if ModuleSpec:
+    #    ModuleType.__setattr__(mod, '__spec__',
+    #            ModuleSpec(modname, None))
+    return mod
 
 
 def lazy_callable(modname, *names, **kwargs):
@@ -474,12 +553,14 @@ def lazy_callable(modname, *names, **kwargs):
     error_strings = _setdef(kwargs, 'error_strings', {})
     _set_default_errornames(modname, error_strings, call=True)
 
+    # No need to copy error_strings: _lazy_module only ever copies it when
+    # creating a new LazyModule, and it isn't otherwise modified.
     if not names:
         # We allow passing a single string as 'modname.callable_name',
         # in which case the wrapper is returned directly and not as a list.
-        return _lazy_callable(modname, name, error_strings.copy(),
+        return _lazy_callable(modname, name, error_strings,
                                 lazy_mod_class, lazy_call_class)
-    return tuple(_lazy_callable(modname, cname, error_strings.copy(),
+    return tuple(_lazy_callable(modname, cname, error_strings,
                         lazy_mod_class, lazy_call_class) for cname in names)
 
 lazy_function = lazy_class = lazy_callable
@@ -489,11 +570,18 @@ def _lazy_callable(modname, cname, error_strings,
     # We could do most of this in the LazyCallable __init__, but here we can
     # pre-check whether to actually be lazy or not.
     module = _lazy_module(modname, error_strings, lazy_mod_class)
-    modclass = type(module)
-    if (issubclass(modclass, LazyModule) and
-        hasattr(modclass, '_lazy_import_callables')):
-        modclass._lazy_import_callables.setdefault(
-            cname, lazy_call_class(module, cname))
+    # Same locking as for the submodule bookkeeping in _lazy_module.
+    with _ImportLockContext():
+        if isinstance(module, LazyModule):
+            moddict = _MOD_DICT(module)
+            callables = moddict.get('_lazy_import_callables')
+            if callables is None:
+                callables = moddict['_lazy_import_callables'] = {}
+            # Wrappers are only created the first time a callable is
+            # requested.
+            if not cname in callables:
+                callables[cname] = lazy_call_class(module, cname)
+        # Otherwise already loaded. No need for a wrapper.
     return getattr(module, cname)
 
 
@@ -504,63 +592,118 @@ def _lazy_callable(modname, cname, error_strings,
 def _load_module(module):
     """Ensures that a module, and its parents, are properly loaded
 
+    Successfully loaded modules are flagged with a `__lazy_loaded__`
+    attribute, so that further calls can return early.
     """
-    modclass = type(module)
-    # We only take care of our own LazyModule instances
-    if not issubclass(modclass, LazyModule):
-        raise TypeError("Passed module is not a LazyModule instance.")
-    with _ImportLockContext():
-        parent, _, modname = module.__name__.rpartition('.')
-        logger.debug("loading module {}".format(modname))
-        # We first identify whether this is a loadable LazyModule, then we
-        # strip as much of lazy_import behavior as possible (keeping it cached,
-        # in case loading fails and we need to reset the lazy state).
-        if not hasattr(modclass, '_lazy_import_error_msgs'):
-            # Alreay loaded (no _lazy_import_error_msgs attr). Not reloading.
+    moddict = _MOD_DICT(module)
+    if moddict.get('__lazy_loaded__'):
+        return
+    modname = moddict['__name__']
+    # Like Python's own import machinery, we use per-module locks (the very
+    # same ones), so that independent modules can be loaded concurrently.
+    with _ModuleLockManager(modname):
+        # Another thread may have loaded the module while we waited for the
+        # lock (in which case it's no longer a LazyModule instance).
+        if moddict.get('__lazy_loaded__'):
             return
-        # First, ensure the parent is loaded (using recursion; *very* unlikely
-        # we'll ever hit a stack limit in this case).
-        modclass._LOADING = True
+        # We only take care of our own LazyModule instances
+        if not isinstance(module, LazyModule):
+            raise TypeError("Passed module is not a LazyModule instance.")
+        # We first collect the module and its parents that are loadable
+        # LazyModules (those with a _lazy_import_error_msgs attr), or that
+        # another thread is loading (flagged with a False __lazy_loaded__),
+        # going up until an already loaded one is hit. They're then loaded in
+        # one go, from the base down, waiting on their locks.
+        lazy_mods = []
+        mod = module
+        while isinstance(mod, ModuleType):
+            lazy_dict = _MOD_DICT(mod)
+            if isinstance(mod, LazyModule):
+                if not '_lazy_import_error_msgs' in lazy_dict:
+                    break
+            elif lazy_dict.get('__lazy_loaded__') is not False:
+                break
+            lazy_mods.append(mod)
+            parent = lazy_dict['__name__'].rpartition('.')[0]
+            if not parent:
+                break
+            mod = sys.modules[parent]
         try:
-            if parent:
-                logger.debug("first loading parent module {}".format(parent))
-                setattr(sys.modules[parent], modname, module)
-            if not hasattr(modclass, '_LOADING'):
-                logger.debug("Module {} already loaded by the parent"
-                             .format(modname))
-                # We've been loaded by the parent. Let's bail.
-                return
-            cached_data = _clean_lazymodule(module)
-            try:
-                # Get Python to do the real import!
-                reload_module(module)           
-            except:
-                # Loading failed. We reset our lazy state.
-                logger.debug("Failed to load module {}. Resetting..."
-                             .format(modname))
-                _reset_lazymodule(module, cached_data)
-                raise
-            else:
-                # Successful load
-                logger.debug("Successfully loaded module {}".format(modname))
-                delattr(modclass, '_LOADING')
-                _reset_lazy_submod_refs(module)
-
-        except (AttributeError, ImportError) as err:
+            for mod in reversed(lazy_mods):
+                lazy_dict = _MOD_DICT(mod)
+                parent, _, submodname = lazy_dict['__name__'].rpartition('.')
+                with _ModuleLockManager(lazy_dict['__name__']):
+                    if not '_lazy_import_error_msgs' in lazy_dict:
+                        # Loaded meanwhile, either by another thread or by
+                        # the parent's loading.
+                        logger.debug("Module {} already loaded"
+                                     .format(submodname))
+                        continue
+                    logger.debug("loading module {}".format(submodname))
+                    if parent:
+                        setattr(sys.modules[parent], submodname, mod)
+                    # We strip as much of lazy_import behavior as possible
+                    # (keeping it cached, in case loading fails and we need to
+                    # reset the lazy state). Registration (in _lazy_module)
+                    # updates lazy state under the global import lock, so we
+                    # switch states under it as well.
+                    with _ImportLockContext():
+                        cached_data = _clean_lazymodule(mod)
+                        # Tells other threads that this module is being
+                        # loaded (and not a regular module).
+                        lazy_dict['__lazy_loaded__'] = False
+                    try:
+                        # Get Python to do the real import!
+                        _exec_module(mod)
+                    except:
+                        # Loading failed. We reset our lazy state.
+                        logger.debug("Failed to load module {}. Resetting..."
+                                     .format(submodname))
+                        with _ImportLockContext():
+                            _reset_lazymodule(mod, cached_data)
+                        raise
+                    else:
+                        # Successful load
+                        logger.debug("Successfully loaded module {}"
+                                     .format(submodname))
+                        lazy_dict['__lazy_loaded__'] = True
+                        _reset_lazy_submod_refs(mod, cached_data)
+
+        except ImportError as err:
             logger.debug("Failed to load {}.\n{}: {}"
                          .format(modname, err.__class__.__name__, err))
             logger.lazy_trace()
-            # Under Python 3 reloading our dummy LazyModule instances causes an
-            # AttributeError if the module can't be found. Would be preferrable
-            # if we could always rely on an ImportError. As it is we vet the
-            # AttributeError as thoroughly as possible.
-            if ((six.PY3 and isinstance(err, AttributeError)) and not
-                err.args[0] == "'NoneType' object has no attribute 'name'"):
-                # Not the AttributeError we were looking for.
-                raise
-            msg = modclass._lazy_import_error_msgs['msg']
-            raise_from(ImportError(
-                msg.format(**modclass._lazy_import_error_strings)), None)
+            # The message is rendered only once, on the first failure, and
+            # kept with the module's error strings (extra keys are ignored by
+            # str.format).
+            err_s = moddict['_lazy_import_error_strings']
+            try:
+                msg = err_s['_rendered_msg']
+            except KeyError:
+                msg = err_s['_rendered_msg'] = (
+                    moddict['_lazy_import_error_msgs']['msg'].format(**err_s))
+            raise ImportError(msg) from None
+
+
+def _exec_module(module):
+    """Finds a module's spec and executes the module in place.
+
+    This is what :func:`importlib.reload` does, minus bookkeeping that isn't
+    needed for lazy modules. Missing modules always raise an ImportError.
+    """
+    name = module.__name__
+    parent = name.rpartition('.')[0]
+    path = None
+    if parent:
+        try:
+            path = sys.modules[parent].__path__
+        except AttributeError:
+            raise ImportError("{!r}; {!r} is not a package"
+                              .format(name, parent), name=name) from None
+    spec = _find_spec(name, path, module)
+    if spec is None:
+        raise ImportError("No module named {!r}".format(name), name=name)
+    _exec(spec, module)
 
 
 ##############################
@@ -576,18 +719,47 @@ _MSG_CALLABLE = ("{caller} attempted to use a functionality that requires "
            "module. Please install a version of {install_name} that has "
            "{module}.{callable} and retry.")
 
-_CLS_ATTRS = ("_lazy_import_error_strings", "_lazy_import_error_msgs",
-              "_lazy_import_callables", "_lazy_import_submodules", "__repr__")
+# LazyModule instance state. Must be kept in sync with _new_lazymodule and
+# _clean_lazymodule (which removes it all, and returns the deletion
+# dictionaries).
+_LAZY_ATTRS = ("_lazy_import_error_strings", "_lazy_import_error_msgs",
+               "_lazy_import_callables", "_lazy_import_submodules")
 
 _DELETION_DICT = ("_lazy_import_submodules",)
 
+_ERR_MSGS_CACHE = {}
+_ERR_MSGS_CACHE_SIZE = 128
+
 def _setdef(argdict, name, defaultvalue):
     """Like dict.setdefault but sets the default value also if None is present.
 
     """
-    if not name in argdict or argdict[name] is None:
-        argdict[name] = defaultvalue
-    return argdict[name]
+    value = argdict.get(name)
+    if value is None:
+        argdict[name] = value = defaultvalue
+    return value
+
+
+def _error_msgs(msg, msg_callable=None):
+    """Returns a (shared) error message dictionary for LazyModule instances.
+
+    The same few messages are used over and over across lazy registrations,
+    so dictionaries are cached (in a FIFO of `_ERR_MSGS_CACHE_SIZE` entries)
+    rather than created for each new LazyModule. They must not be modified.
+    """
+    key = (msg, msg_callable)
+    try:
+        return _ERR_MSGS_CACHE[key]
+    except KeyError:
+        pass
+    err_msgs = {'msg': msg}
+    if msg_callable is not None:
+        err_msgs['msg_callable'] = msg_callable
+    if len(_ERR_MSGS_CACHE) >= _ERR_MSGS_CACHE_SIZE:
+        # FIFO eviction
+        del _ERR_MSGS_CACHE[next(iter(_ERR_MSGS_CACHE))]
+    _ERR_MSGS_CACHE[key] = err_msgs
+    return err_msgs
 
 
 def module_basename(modname):
@@ -617,10 +789,10 @@ def _caller_name(depth=2, default=''):
 
 
 def _clean_lazymodule(module):
-    """Removes all lazy behavior from a module's class, for loading.
+    """Removes all lazy behavior from a module, for loading.
 
-    Also removes all module attributes listed under the module's class deletion
-    dictionaries. Deletion dictionaries are class attributes with names
+    Also removes all module attributes listed under the module's deletion
+    dictionaries. Deletion dictionaries are lazy-state attributes with names
     specified in `_DELETION_DICT`.
 
     Parameters
@@ -630,67 +802,81 @@ def _clean_lazymodule(module):
     Returns
     -------
     dict
-        A dictionary of deleted class attributes, that can be used to reset the
-        lazy state using :func:`_reset_lazymodule`.
+        A dictionary with the module's original `__class__` and a copy of
+        its original `__dict__`, used by :func:`_reset_lazymodule` to reset
+        the lazy state, and with its deletion dictionaries, used by
+        :func:`_reset_lazy_submod_refs` to restore submodule references.
     """
-    modclass = type(module)
+    moddict = _MOD_DICT(module)
+    # Snapshot the whole dict: a failed load can leave behind anything that
+    # was set before the failure.
+    snapshot = moddict.copy()
     _clean_lazy_submod_refs(module)
 
-    modclass.__getattribute__ = ModuleType.__getattribute__
-    modclass.__setattr__ = ModuleType.__setattr__
-    cls_attrs = {}
-    for cls_attr in _CLS_ATTRS:
-        try:
-            cls_attrs[cls_attr] = getattr(modclass, cls_attr)
-            delattr(modclass, cls_attr)
-        except AttributeError:
-            pass
-    return cls_attrs
+    # Spelled out rather than looped over _LAZY_ATTRS, since this runs for
+    # every module that gets loaded. The error strings/messages are always
+    # set up by _new_lazymodule; the callables and submodules only if needed.
+    del moddict['_lazy_import_error_strings']
+    del moddict['_lazy_import_error_msgs']
+    moddict.pop('_lazy_import_callables', None)
+    lazy_attrs = {
+        '__class__': type(module),
+        '__dict__': snapshot,
+        '_lazy_import_submodules':
+            moddict.pop('_lazy_import_submodules', None),
+        }
+    _MOD_SETATTR(module, '__class__', ModuleType)
+    return lazy_attrs
 
 
 def _clean_lazy_submod_refs(module):
-    modclass = type(module)
+    moddict = _MOD_DICT(module)
     for deldict in _DELETION_DICT:
         try:
-            delnames = getattr(modclass, deldict)
-        except AttributeError:
+            delnames = moddict[deldict]
+        except KeyError:
             continue
         for delname in delnames:
             try:
-                super(LazyModule, module).__delattr__(delname)
-            except AttributeError:
+                del moddict[delname]
+            except KeyError:
                 # Maybe raise a warning?
                 pass
 
 
-def _reset_lazymodule(module, cls_attrs):
+def _reset_lazymodule(module, lazy_attrs):
     """Resets a module's lazy state from cached data.
 
+    The module's `__dict__` is restored exactly as it was before loading, so
+    that nothing set by the failed load survives it.
     """
-    modclass = type(module)
-    del modclass.__getattribute__
-    del modclass.__setattr__
-    try:
-        del modclass._LOADING
-    except AttributeError:
-        pass
-    for cls_attr in _CLS_ATTRS:
-        try:
-            setattr(modclass, cls_attr, cls_attrs[cls_attr])
-        except KeyError:
-            pass
-    _reset_lazy_submod_refs(module)
+    moddict = _MOD_DICT(module)
+    moddict.clear()
+    moddict.update(lazy_attrs['__dict__'])
+    _MOD_SETATTR(module, '__class__', lazy_attrs['__class__'])
 
 
-def _reset_lazy_submod_refs(module):
-    modclass = type(module)
+def _reset_lazy_submod_refs(module, lazy_attrs):
     for deldict in _DELETION_DICT:
-        try:
-            resetnames = getattr(modclass, deldict)
-        except AttributeError:
+        resetnames = lazy_attrs.get(deldict)
+        if not resetnames:
             continue
         for name, submod in resetnames.items(): 
-            super(LazyModule, module).__setattr__(name, submod)
+            _MOD_SETATTR(module, name, submod)
+
+
+def _from_ipython_inspection(attr):
+    # IPython tries to be too clever and constantly inspects, asking for
+    #  modules' attrs, which causes premature module loading and unesthetic
+    #  internal errors if the lazily-loaded module doesn't exist.
+    if (run_from_ipython()
+        and (attr.startswith(("__", "_ipython"))
+             or attr == "_repr_mimebundle_")
+        and module_basename(_caller_name(3)) in ('inspect', 'IPython')):
+            logger.debug("Ignoring request for {}, deemed from IPython's "
+                         "inspection.".format(attr))
+            return True
+    return False
 
 
 def run_from_ipython():
@@ -701,3 +887,12 @@ def run_from_ipython():
     except NameError:
         return False
 
+
+def __getattr__(name):
+    # Module-level __getattr__ (PEP 562), for the lazy reading of __version__.
+    if name == '__version__':
+        global __version__
+        __version__ = _read_version()
+        return __version__
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
@@ -23,11 +23,11 @@
 import pytest
 import importlib
 import sys
-import six
-from six.moves import range
 import itertools
 import string
 import random
+import threading
+import time
 random.seed(42) # For consistency when parallel-testing
 
 import lazy_import
@@ -41,9 +41,9 @@ def run(np=None):
     import os
     path = os.path.dirname(__file__)
     if np > 1:
-        pytest.main(['-n', str(np), '--boxed', path])
+        pytest.main(['-n', str(np), '--forked', path])
     else:
-        pytest.main(['--boxed', path])
+        pytest.main(['--forked', path])
 ###############################################################################
 # Constants and util functions
 
@@ -68,7 +68,7 @@ class _TestLazyModule(lazy_import.LazyModule):
 _GENERATED_NAMES = []
 # Modules not usually loaded on startup. Must include at least one with
 #  submodule
-NAMES_EXISTING = ("sched", "distutils.core")
+NAMES_EXISTING = ("sched", "wsgiref.simple_server")
 
 LEVELS = ("leaf", "base")
 CLASSES = (_TestLazyModule, lazy_import.LazyModule)
@@ -118,8 +118,8 @@ def _check_lazy_loading(modname):
     if modname in NAMES_EXISTING:
         if modname == 'sched':
             import sched as newmod
-        elif modname == 'distutils.core':
-            import distutils.core as newmod
+        elif modname == 'wsgiref.simple_server':
+            import wsgiref.simple_server as newmod
         assert str(newmod) == "Lazily-loaded module " + modname
 
     # Check that all submodules are in and that submodule access works
@@ -153,7 +153,7 @@ def _check_callable_missing(obj, msg=None):
 
 def _check_not_loaded(modname):
     assert modname not in sys.modules, \
-        modname + " already loaded. Maybe use with pytest's xdist's '--boxed'?"
+        modname + " already loaded. Maybe use with pytest-forked's '--forked'?"
 
 ###############################################################################
 # TESTS                              TESTS                              TESTS #
@@ -199,6 +199,8 @@ def test_opts(nsub, lazy_opts):
     else:
         expected_err = errors["msg"].format(**errors)
     _check_module_missing(mod, msg=expected_err)
+    # Again, for the cached error message
+    _check_module_missing(mod, msg=expected_err)
 
 
 @pytest.mark.parametrize("nsub, errors, cnames, fn",
@@ -207,7 +209,7 @@ def test_opts(nsub, lazy_opts):
 def test_callable_missing_module(nsub, errors, cnames, fn):
     modname = random_modname(nsub)
     basename = lazy_import.module_basename(modname)
-    if isinstance(cnames, six.string_types):
+    if isinstance(cnames, str):
         lazys = (fn(modname+"."+cnames, error_strings=errors),)
         cnames = (cnames, )
     else:
@@ -227,7 +229,7 @@ def test_callable_missing_module(nsub, errors, cnames, fn):
 def test_callable_missing(modname, errors, cnames, fn):
     _check_not_loaded(modname)
     basename = lazy_import.module_basename(modname)
-    if isinstance(cnames, six.string_types):
+    if isinstance(cnames, str):
         lazys = (fn(modname+"."+cnames, error_strings=errors),)
         cnames = (cnames, )
     else:
@@ -248,7 +250,7 @@ def test_callable_missing(modname, errors, cnames, fn):
                           CALLABLE_ALIASES))
 def test_error_callable_as_baseclass(modname, errors, cnames, fn):
     _check_not_loaded(modname)
-    if isinstance(cnames, six.string_types):
+    if isinstance(cnames, str):
         lazys = (fn(modname+"."+cnames, error_strings=errors),)
     else:
         lazys = fn(modname, *cnames, error_strings=errors)
@@ -271,3 +273,146 @@ def test_load_lazysub_on_fullmodule(modname, lazy_opts):
         assert not isinstance(mod, modclass)
     else:
         assert isinstance(mod, modclass)
+
+@pytest.mark.parametrize("modname", NAMES_EXISTING)
+def test_loaded_is_plain_module(modname, lazy_opts):
+    _check_not_loaded(modname)
+    level, modclass, errors = lazy_opts
+    mod = lazy_import.lazy_module(modname, error_strings=errors,
+                                   lazy_mod_class=modclass, level=level)
+    assert isinstance(mod, modclass)
+    mod.__file__ # Triggers the loading
+    assert type(mod) is type(sys)
+    assert mod.__lazy_loaded__
+    for attr in lazy_import._LAZY_ATTRS:
+        assert attr not in mod.__dict__
+
+@pytest.mark.parametrize("modname", NAMES_EXISTING)
+def test_doc_loads(modname, lazy_opts):
+    _check_not_loaded(modname)
+    level, modclass, errors = lazy_opts
+    mod = lazy_import.lazy_module(modname, error_strings=errors,
+                                   lazy_mod_class=modclass, level=level)
+    doc = mod.__doc__
+    assert type(mod) is type(sys)
+    assert doc is not None
+    assert doc == mod.__doc__
+
+def test_class_doc():
+    assert lazy_import.LazyModule.__doc__.startswith("Class for lazily-loaded")
+    assert _TestLazyModule.__doc__ is None
+
+@pytest.mark.parametrize("modname", NAMES_EXISTING)
+def test_vars_loads(modname, lazy_opts):
+    _check_not_loaded(modname)
+    level, modclass, errors = lazy_opts
+    mod = lazy_import.lazy_module(modname, error_strings=errors,
+                                   lazy_mod_class=modclass, level=level)
+    moddict = vars(mod)
+    assert type(mod) is type(sys)
+    assert moddict is mod.__dict__
+    assert '__file__' in moddict
+    for attr in lazy_import._LAZY_ATTRS:
+        assert attr not in moddict
+
+def test_callable_replaced_on_load():
+    modname = "sched"
+    _check_not_loaded(modname)
+    lazy = lazy_import.lazy_callable(modname + ".scheduler")
+    mod = sys.modules[modname]
+    assert isinstance(mod.scheduler, lazy_import.LazyCallable)
+    lazy()
+    assert not isinstance(mod.scheduler, lazy_import.LazyCallable)
+    assert lazy.callable is mod.scheduler
+
+def test_failed_load_resets(tmp_path, monkeypatch):
+    modname = random_modname()
+    (tmp_path / (modname + ".py")).write_text(
+        "early = 1\nimport {}\n".format(random_modname()))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    mod = lazy_import.lazy_module(modname)
+    for _ in range(2):
+        with pytest.raises(ImportError):
+            mod.early
+        assert isinstance(mod, lazy_import.LazyModule)
+        assert mod.__spec__ is None
+        for attr in ('__file__', '__loader__', '__package__'):
+            with pytest.raises(ImportError):
+                getattr(mod, attr)
+
+def test_register_during_load(tmp_path, monkeypatch):
+    # Submodules registered while their parent is being loaded must not
+    # leave lazy state behind in the loaded parent.
+    modname = random_modname()
+    pkgdir = tmp_path / modname
+    pkgdir.mkdir()
+    (pkgdir / "__init__.py").write_text(
+        "import lazy_import\n"
+        "sub = lazy_import.lazy_module(__name__ + '.sub')\n")
+    (pkgdir / "sub.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    mod = lazy_import.lazy_module(modname)
+    assert isinstance(mod.sub, lazy_import.LazyModule)
+    assert type(mod) is type(sys)
+    for attr in lazy_import._LAZY_ATTRS:
+        assert attr not in vars(mod)
+
+def test_parent_loading_in_thread(tmp_path, monkeypatch):
+    # A submodule must wait for a parent that another thread is loading.
+    modname = random_modname()
+    pkgdir = tmp_path / modname
+    pkgdir.mkdir()
+    (pkgdir / "__init__.py").write_text(
+        "import time\ntime.sleep(0.5)\nCONST = 5\n")
+    (pkgdir / "sub.py").write_text(
+        "from {} import CONST\nx = CONST\n".format(modname))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sub = lazy_import.lazy_module(modname + ".sub")
+    base = sys.modules[modname]
+    results = {}
+    def get(name, obj, attr, delay=0):
+        time.sleep(delay)
+        try:
+            results[name] = getattr(obj, attr)
+        except Exception as err:
+            results[name] = err
+    threads = [threading.Thread(target=get, args=("base", base, "CONST")),
+               threading.Thread(target=get, args=("sub", sub, "x", 0.1))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {"base": 5, "sub": 5}
+
+def test_caller_name_per_namespace():
+    code = compile("mod = lazy_import.lazy_module(modname)", "<test>", "exec")
+    for caller in ("first_caller", "second_caller"):
+        namespace = {"__name__": caller, "lazy_import": lazy_import,
+                     "modname": random_modname()}
+        exec(code, namespace)
+        with pytest.raises(ImportError) as excinfo:
+            namespace["mod"].modattr
+        assert str(excinfo.value).startswith(caller + " attempted")
+
+@pytest.mark.parametrize("nsub", range(3))
+def test_dir_loads(nsub):
+    modname = random_modname(nsub)
+    mod = lazy_import.lazy_module(modname)
+    _check_module_missing(mod)
+    with pytest.raises(ImportError):
+        dir(mod)
+
+@pytest.mark.parametrize("fn", CALLABLE_ALIASES)
+def test_callable_reuse(fn):
+    modname = random_modname()
+    lazy = fn(modname + ".fn1")
+    assert fn(modname + ".fn1") is lazy
+    assert isinstance(lazy, lazy_import.LazyCallable)
+
+def test_callable_presentload():
+    import os.path
+    assert lazy_import.lazy_callable("os.path.join") is os.path.join
+
+def test_version():
+    with open(lazy_import.VERSION_FILE) as infile:
+        assert lazy_import.__version__ == infile.read().strip()